@@ -0,0 +1,58 @@
+"""Compare reading compressed files directly against decompress-then-parse.
+
+Run from the repository root: PYTHONPATH=src python benchmarks/bench_compressed_io.py
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from services.file_reader import FileReader
+from tests.conftest import sample_file_lines
+from utils.compression import open_file
+from utils.constraints import FieldLimits
+from utils.logger import logger
+
+
+def build_plain_file(file_path: str, transactions: int) -> None:
+    with open(file_path, "w") as f:
+        f.writelines(sample_file_lines([(amount, "USD") for amount in range(1, transactions + 1)]))
+
+
+def decompress_then_parse(compressed_path: str, work_dir: str) -> int:
+    plain_path = os.path.join(work_dir, "decompressed.txt")
+    with open_file(compressed_path, "rb") as src, open(plain_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    FileReader.read_file(plain_path)
+    plain_size = os.path.getsize(plain_path)
+    os.remove(plain_path)
+    return os.path.getsize(compressed_path) + 2 * plain_size
+
+
+def parse_streaming(compressed_path: str, work_dir: str) -> int:
+    FileReader.read_file(compressed_path)
+    return os.path.getsize(compressed_path)
+
+
+def main() -> None:
+    logger.setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as work_dir:
+        plain_path = os.path.join(work_dir, "plain.txt")
+        build_plain_file(plain_path, FieldLimits.MAX_TRANSACTIONS)
+
+        for compression in ("gzip", "bz2", "xz"):
+            compressed_path = os.path.join(work_dir, f"archive.{compression}")
+            with open(plain_path, "rb") as src, open_file(compressed_path, "wb", compression=compression) as dst:
+                shutil.copyfileobj(src, dst)
+
+            for name, run in (("decompress+parse", decompress_then_parse), ("streaming", parse_streaming)):
+                start = time.perf_counter()
+                disk_bytes = run(compressed_path, work_dir)
+                elapsed = time.perf_counter() - start
+                print(f"{compression:<5} {name:<17} {elapsed * 1000:8.1f} ms  {disk_bytes:>10} bytes of disk I/O")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Compare validated and trusted Transaction construction at MAX_TRANSACTIONS scale.
+
+Run from the repository root: PYTHONPATH=src python benchmarks/bench_record_construction.py
+"""
+
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Callable
+
+from models.transaction import Transaction
+from utils.constraints import FieldLimits
+
+
+def build_validated() -> list[Transaction]:
+    return [
+        Transaction("02", f"{counter:06d}", f"{counter:012d}", "USD")
+        for counter in range(1, FieldLimits.MAX_TRANSACTIONS + 1)
+    ]
+
+
+def build_trusted() -> list[Transaction]:
+    return [
+        Transaction.from_values("02", counter, Decimal(counter).scaleb(-2), "USD")
+        for counter in range(1, FieldLimits.MAX_TRANSACTIONS + 1)
+    ]
+
+
+def measure(name: str, build: Callable[[], list[Transaction]]) -> None:
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    transactions = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_record = allocated / len(transactions)
+    print(f"{name:<10} {elapsed * 1000:8.1f} ms  {per_record:6.0f} bytes/record")
+
+
+def main() -> None:
+    measure("validated", build_validated)
+    measure("trusted", build_trusted)
+
+
+if __name__ == "__main__":
+    main()
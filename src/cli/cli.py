@@ -2,6 +2,10 @@ from typing import Callable
 import os
 from services.file_reader import FileReader
 from services.file_writer import FileWriter
+from services.file_validator import FileValidator
+from services.file_differ import FileDiffer
+from services.file_sorter import SORT_KEYS, FileSorter
+from services.directory_watcher import DirectoryWatcher
 from models.fixed_width_file import FixedWidthFile
 from models.transaction import Transaction
 from utils.exceptions import (
@@ -31,7 +35,11 @@ class CLI:
             "5": self._add_transaction,
             "6": self._lock_field,
             "7": self._unlock_field,
-            "8": exit,
+            "8": self._validate_file,
+            "9": self._diff_files,
+            "10": self._sort_file,
+            "11": self._watch_directory,
+            "12": exit,
         }
         logger.info("CLI initialized")
 
@@ -52,7 +60,11 @@ class CLI:
         print("5. Add transaction")
         print("6. Lock field")
         print("7. Unlock field")
-        print("8. Exit")
+        print("8. Validate file (report all errors)")
+        print("9. Compare two files")
+        print("10. Sort file")
+        print("11. Watch directory")
+        print("12. Exit")
 
     def _handle_choice(self, choice: str) -> None:
         try:
@@ -94,7 +106,7 @@ class CLI:
             input("Enter the path to save the file (leave empty to save to the same path): ") or self.file_path
         )
         try:
-            FileWriter.write_file(file_path, self.fw_file)
+            FileWriter.save_file(file_path, self.fw_file)
             logger.info(f"File saved successfully to {file_path}")
             print(f"File saved successfully to {file_path}")
             self.file_path = file_path
@@ -102,6 +114,93 @@ class CLI:
             logger.error(f"Error saving file to {file_path}: {str(e)}")
             print(f"Error saving file: {str(e)}")
 
+    def _validate_file(self) -> None:
+        file_path = input("Enter the path to the file: ")
+        if not os.path.exists(file_path):
+            logger.warning(f"Attempted to validate non-existent file: {file_path}")
+            print("File does not exist. Please check the path and try again.")
+            return
+        max_errors = self._get_valid_input(
+            "Enter the maximum number of errors to report (leave empty for no limit): ",
+            lambda x: x == "" or (x.isdigit() and int(x) > 0),
+            "Invalid number. Please enter a positive number or leave empty.",
+        )
+
+        report = FileValidator.validate_file(file_path, max_errors=int(max_errors) if max_errors else None)
+        logger.info(f"File {file_path} validated, {len(report.issues)} issue(s) found")
+        if report.is_valid:
+            print(f"File is valid ({report.lines_checked} lines checked).")
+            return
+        for issue in report.issues:
+            print(issue)
+        print(f"{len(report.issues)} issue(s) found in {report.lines_checked} lines checked.")
+        if report.truncated:
+            print("Error limit reached, validation stopped early.")
+
+    def _diff_files(self) -> None:
+        old_path = input("Enter the path to the original file: ")
+        new_path = input("Enter the path to the changed file: ")
+        for file_path in (old_path, new_path):
+            if not os.path.exists(file_path):
+                logger.warning(f"Attempted to compare non-existent file: {file_path}")
+                print(f"File {file_path} does not exist. Please check the path and try again.")
+                return
+
+        patch_path = input("Enter the path to save a patch (leave empty to skip): ") or None
+
+        differences = 0
+        for difference in FileDiffer.iter_differences(old_path, new_path, patch_path):
+            print(difference)
+            differences += 1
+        logger.info(f"Compared {old_path} with {new_path}, {differences} difference(s) found")
+        print(f"{differences} difference(s) found." if differences else "Files are identical.")
+        if patch_path:
+            print(f"Patch saved to {patch_path}")
+
+    def _sort_file(self) -> None:
+        input_path = input("Enter the path to the file: ")
+        if not os.path.exists(input_path):
+            logger.warning(f"Attempted to sort non-existent file: {input_path}")
+            print("File does not exist. Please check the path and try again.")
+            return
+        output_path = input("Enter the path to save the sorted file (leave empty to sort in place): ") or input_path
+        keys = self._get_valid_input(
+            f"Enter sort keys separated by commas ({', '.join(SORT_KEYS)}): ",
+            lambda x: all(key.strip().lower() in SORT_KEYS for key in x.split(",")),
+            f"Invalid sort keys. Please use {', '.join(SORT_KEYS)}.",
+        )
+        descending = self._get_valid_input(
+            "Sort descending? (y/n): ",
+            lambda x: x.lower() in ["y", "n"],
+            "Invalid answer. Please enter y or n.",
+        )
+
+        count = FileSorter.sort_file(
+            input_path,
+            output_path,
+            keys=tuple(key.strip() for key in keys.split(",")),
+            reverse=descending == "y",
+        )
+        print(f"{count} transactions sorted and saved to {output_path}")
+
+    def _watch_directory(self) -> None:
+        directory = input("Enter the path to the directory: ")
+        if not os.path.isdir(directory):
+            logger.warning(f"Attempted to watch non-existent directory: {directory}")
+            print("Directory does not exist. Please check the path and try again.")
+            return
+        state_path = input("Enter the path to the state file (leave empty for the default): ") or None
+
+        watcher = DirectoryWatcher(directory, state_path)
+        logger.info(f"Watching directory {directory}")
+        print("Watching for new or changed files. Press Ctrl+C to stop.")
+        try:
+            for state in watcher.watch():
+                print(state)
+        except KeyboardInterrupt:
+            logger.info(f"Stopped watching directory {directory}")
+            print("Stopped watching.")
+
     def _get_field_value(self) -> None:
         if not self.fw_file:
             print("No file is currently loaded. Please load a file first.")
@@ -4,6 +4,8 @@ from utils.exceptions import FieldValueValidationException
 
 
 class BaseField(ABC):
+    __slots__ = ("field_id",)
+
     def __init__(self, field_id: str) -> None:
         self.field_id = field_id
 
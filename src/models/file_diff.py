@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FieldChange:
+    record_type: str
+    index: int | None
+    field: str
+    old_value: str
+    new_value: str
+
+    def __str__(self) -> str:
+        location = self.record_type if self.index is None else f"{self.record_type}[{self.index}]"
+        return f"{location}.{self.field}: {self.old_value!r} -> {self.new_value!r}"
+
+
+@dataclass(frozen=True)
+class TailRecordChange:
+    change: str
+    index: int
+    record: str
+
+    def __str__(self) -> str:
+        return f"transaction[{self.index}] {self.change}: {self.record.rstrip()!r}"
@@ -0,0 +1,19 @@
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileSource:
+    path: str
+    size: int
+    mtime_ns: int
+    transaction_count: int
+    footer_record: str
+    compression: str | None = None
+
+    @classmethod
+    def from_path(
+        cls, path: str, transaction_count: int, footer_record: str, compression: str | None = None
+    ) -> "FileSource":
+        stat = os.stat(path)
+        return cls(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, transaction_count, footer_record, compression)
@@ -1,4 +1,5 @@
 from decimal import Decimal
+from models.file_source import FileSource
 from models.footer import Footer
 from models.header import Header
 from models.transaction import Transaction
@@ -12,20 +13,35 @@ from utils.exceptions import (
     RecordLimitException,
 )
 from utils.logger import logger
+from utils.rw_lock import NullReadWriteLock, ReadWriteLock
 
 
 class FixedWidthFile:
-    def __init__(self, header: Header, transactions: list[Transaction], footer: Footer) -> None:
+    def __init__(
+        self, header: Header, transactions: list[Transaction], footer: Footer, thread_safe: bool = False
+    ) -> None:
         self.header: Header = header
         self.footer: Footer = footer
         self.transactions: list[Transaction] = transactions
 
         self.field_locker: FieldLocker = FieldLocker()
+        self.lock: ReadWriteLock | NullReadWriteLock = ReadWriteLock() if thread_safe else NullReadWriteLock()
+
+        # Where the file was last loaded from or saved to, and whether anything beyond appended
+        # transactions changed since then; FileWriter.save_file uses both to pick the append-only path.
+        self.source: FileSource | None = None
+        self.modified: bool = False
 
         self.validate()
         logger.info("FixedWidthFile instance created and validated")
 
     def set_field_value(self, field_type: str, field_name: str, field_value: str, index: int | None = None) -> None:
+        with self.lock.write_lock():
+            self._set_field_value(field_type, field_name, field_value, index)
+            self.modified = True
+        logger.info(f"Field value updated: {field_type}.{field_name}")
+
+    def _set_field_value(self, field_type: str, field_name: str, field_value: str, index: int | None) -> None:
         if self.field_locker.is_field_locked(field_type, field_name):
             logger.error(f"Attempted to modify locked field: {field_type}.{field_name}")
             raise FieldLockedException(field_type, field_name)
@@ -40,8 +56,6 @@ class FixedWidthFile:
             logger.error(f"Attempted to set value for unknown field type: {field_type}")
             raise FieldNotFoundException(field_type)
 
-        logger.info(f"Field value updated: {field_type}.{field_name}")
-
     def _set_header_field(self, field_name: str, field_value: str) -> None:
         if not hasattr(self.header, field_name):
             logger.error(f"Attempted to set non-existent header field: {field_name}")
@@ -85,20 +99,49 @@ class FixedWidthFile:
         logger.info(f"Transaction currency updated: index {index}, new currency: {currency}")
 
     def add_transaction(self, transaction: Transaction) -> None:
-        if len(self.transactions) >= FieldLimits.MAX_TRANSACTIONS:
-            logger.error(f"Attempted to add transaction beyond limit of {FieldLimits.MAX_TRANSACTIONS}")
-            raise RecordLimitException(FieldLimits.MAX_TRANSACTIONS)
-
-        self.transactions.append(transaction)
-        self._update_footer_with_last_transaction()
-        logger.info(f"New transaction added, total count: {len(self.transactions)}")
+        with self.lock.write_lock():
+            if len(self.transactions) >= FieldLimits.MAX_TRANSACTIONS:
+                logger.error(f"Attempted to add transaction beyond limit of {FieldLimits.MAX_TRANSACTIONS}")
+                raise RecordLimitException(FieldLimits.MAX_TRANSACTIONS)
+
+            self.transactions.append(transaction)
+            self._update_footer_with_last_transaction()
+            total_count = len(self.transactions)
+        logger.info(f"New transaction added, total count: {total_count}")
+
+    def add_transactions(self, transactions: list[Transaction]) -> None:
+        with self.lock.write_lock():
+            if len(self.transactions) + len(transactions) > FieldLimits.MAX_TRANSACTIONS:
+                logger.error(f"Attempted to add transactions beyond limit of {FieldLimits.MAX_TRANSACTIONS}")
+                raise RecordLimitException(FieldLimits.MAX_TRANSACTIONS)
+
+            self.transactions.extend(transactions)
+            self.footer.total_counter += len(transactions)
+            self.footer.control_sum += sum(transaction.amount for transaction in transactions)
+            total_count = len(self.transactions)
+        logger.info(f"{len(transactions)} transactions added, total count: {total_count}")
+
+    def remove_transaction(self, index: int) -> None:
+        with self.lock.write_lock():
+            if index < 0 or index >= len(self.transactions):
+                logger.error(f"Invalid transaction index: {index}")
+                raise ValueError(f"Invalid transaction index: {index}")
+
+            removed = self.transactions.pop(index)
+            self.modified = True
+            self.footer.total_counter -= 1
+            self.footer.control_sum -= removed.amount
+            total_count = len(self.transactions)
+        logger.info(f"Transaction removed: index {index}, total count: {total_count}")
 
     def lock_field(self, field_type: str, field_name: str) -> None:
-        self.field_locker.lock_field(field_type, field_name)
+        with self.lock.write_lock():
+            self.field_locker.lock_field(field_type, field_name)
         logger.info(f"Field locked: {field_type}.{field_name}")
 
     def unlock_field(self, field_type: str, field_name: str) -> None:
-        self.field_locker.unlock_field(field_type, field_name)
+        with self.lock.write_lock():
+            self.field_locker.unlock_field(field_type, field_name)
         logger.info(f"Field unlocked: {field_type}.{field_name}")
 
     def _update_footer_with_last_transaction(self) -> None:
@@ -109,7 +152,8 @@ class FixedWidthFile:
         )
 
     def validate(self) -> None:
-        self._validate_footer_consistency()
+        with self.lock.read_lock():
+            self._validate_footer_consistency()
         logger.info("FixedWidthFile validated successfully")
 
     def _validate_footer_consistency(self) -> None:
@@ -5,6 +5,8 @@ from utils.exceptions import FieldValueValidationException
 
 
 class Footer(BaseField):
+    __slots__ = ("total_counter", "control_sum")
+
     def __init__(self, field_id: str, total_counter: str, control_sum: str):
         super().__init__(field_id)
         self.total_counter: int = self._process_total_counter(total_counter)
@@ -12,6 +14,15 @@ class Footer(BaseField):
 
         self.validate()
 
+    @classmethod
+    def from_values(cls, field_id: str, total_counter: int, control_sum: Decimal) -> "Footer":
+        # Trusted path for already-typed values known to be valid: skips parsing and validate().
+        footer = cls.__new__(cls)
+        footer.field_id = field_id
+        footer.total_counter = total_counter
+        footer.control_sum = control_sum
+        return footer
+
     def _process_total_counter(self, total_counter: str) -> int:
         try:
             total_counter_int = int(total_counter)
@@ -2,6 +2,8 @@ from models.base import BaseField
 
 
 class Header(BaseField):
+    __slots__ = ("name", "surname", "patronymic", "address")
+
     def __init__(self, field_id: str, name: str, surname: str, patronymic: str, address: str):
         super().__init__(field_id)
         self.name = name
@@ -11,6 +13,17 @@ class Header(BaseField):
 
         self.validate()
 
+    @classmethod
+    def from_values(cls, field_id: str, name: str, surname: str, patronymic: str, address: str) -> "Header":
+        # Trusted path for records known to be valid (e.g. our own FileWriter output): skips validate().
+        header = cls.__new__(cls)
+        header.field_id = field_id
+        header.name = name
+        header.surname = surname
+        header.patronymic = patronymic
+        header.address = address
+        return header
+
     def validate(self) -> None:
         self._validate_field_id(value="01")
         if len(self.name) == 0:
@@ -5,6 +5,8 @@ from utils.exceptions import FieldValueValidationException
 
 
 class Transaction(BaseField):
+    __slots__ = ("counter", "amount", "currency")
+
     def __init__(self, field_id: str, counter: str, amount: str, currency: str):
         super().__init__(field_id=field_id)
         self.counter: int = self._process_counter(counter)
@@ -13,6 +15,16 @@ class Transaction(BaseField):
 
         self.validate()
 
+    @classmethod
+    def from_values(cls, field_id: str, counter: int, amount: Decimal, currency: str) -> "Transaction":
+        # Trusted path for already-typed values known to be valid: skips parsing and validate().
+        transaction = cls.__new__(cls)
+        transaction.field_id = field_id
+        transaction.counter = counter
+        transaction.amount = amount
+        transaction.currency = currency
+        return transaction
+
     def _process_counter(self, counter: str) -> int:
         try:
             counter_int = int(counter)
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    line_number: int
+    record_type: str
+    field: str
+    value: str
+    rule: str
+
+    def __str__(self) -> str:
+        return f"line {self.line_number}: {self.record_type}.{self.field} = {self.value!r} ({self.rule})"
+
+
+@dataclass
+class ValidationReport:
+    file_path: str
+    max_errors: int | None = None
+    issues: list[ValidationIssue] = field(default_factory=list)
+    lines_checked: int = 0
+    truncated: bool = False
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.issues
+
+    @property
+    def is_full(self) -> bool:
+        return self.max_errors is not None and len(self.issues) >= self.max_errors
+
+    def add_issue(self, line_number: int, record_type: str, field_name: str, value: str, rule: str) -> None:
+        if self.is_full:
+            self.truncated = True
+            return
+        self.issues.append(ValidationIssue(line_number, record_type, field_name, value, rule))
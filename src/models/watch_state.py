@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FileState:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    valid: bool
+    error: str | None = None
+
+    def __str__(self) -> str:
+        return f"{self.path}: {'valid' if self.valid else f'invalid ({self.error})'}"
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Iterator
+
+from models.watch_state import FileState
+from services.file_reader import FileReader
+from utils.logger import logger
+
+DEFAULT_STATE_FILE = ".watch_state.json"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class DirectoryWatcher:
+    # Listing the directory costs one stat per entry; hashing and validation only run for files
+    # whose size or mtime changed since the last poll, on a pool of at most max_workers threads.
+    def __init__(
+        self, directory: str, state_path: str | None = None, max_workers: int = 4, poll_interval: float = 5.0
+    ) -> None:
+        self.directory = directory
+        self.state_path = os.path.abspath(state_path or os.path.join(directory, DEFAULT_STATE_FILE))
+        self.temp_state_path = f"{self.state_path}.tmp"
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.states: dict[str, FileState] = self._load_state()
+
+    def watch(self, max_polls: int | None = None) -> Iterator[FileState]:
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll()
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(self.poll_interval)
+
+    def poll(self) -> Iterator[FileState]:
+        changed, removed = self._scan()
+        for path in removed:
+            del self.states[path]
+            logger.info(f"File removed from watch state: {path}")
+        if not changed:
+            if removed:
+                self._save_state()
+            return
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(self._check_file, path, stat): path for path, stat in changed}
+                for future in as_completed(futures):
+                    state = future.result()
+                    if state is None:
+                        if self.states.pop(futures[future], None) is not None:
+                            logger.info(f"File removed from watch state: {futures[future]}")
+                        continue
+                    self.states[state.path] = state
+                    yield state
+        finally:
+            self._save_state()
+
+    def _scan(self) -> tuple[list[tuple[str, os.stat_result]], list[str]]:
+        # State is keyed on absolute paths so it survives restarting with a differently spelled directory.
+        changed = []
+        seen = set()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                path = os.path.abspath(entry.path)
+                if not entry.is_file() or path in (self.state_path, self.temp_state_path):
+                    continue
+                seen.add(path)
+                stat = entry.stat()
+                previous = self.states.get(path)
+                if previous is None or previous.size != stat.st_size or previous.mtime_ns != stat.st_mtime_ns:
+                    changed.append((path, stat))
+        removed = [path for path in self.states if path not in seen]
+        return changed, removed
+
+    def _check_file(self, path: str, stat: os.stat_result) -> FileState | None:
+        # Files can be moved out of the directory between the scan and the check; one that has
+        # vanished is reported as None and treated as removed.
+        try:
+            sha256 = self._hash_file(path)
+        except OSError as e:
+            if not os.path.exists(path):
+                return None
+            logger.warning(f"Could not read {path}: {str(e)}")
+            return FileState(path, stat.st_size, stat.st_mtime_ns, "", False, f"{type(e).__name__}: {str(e)}")
+        previous = self.states.get(path)
+        if previous is not None and previous.sha256 == sha256:
+            # Touched but not modified: keep the last result without validating again.
+            return FileState(path, stat.st_size, stat.st_mtime_ns, sha256, previous.valid, previous.error)
+
+        try:
+            FileReader.read_file(path).validate()
+        except Exception as e:
+            if isinstance(e, OSError) and not os.path.exists(path):
+                return None
+            logger.warning(f"Validation failed for {path}: {str(e)}")
+            return FileState(path, stat.st_size, stat.st_mtime_ns, sha256, False, f"{type(e).__name__}: {str(e)}")
+        logger.info(f"File validated: {path}")
+        return FileState(path, stat.st_size, stat.st_mtime_ns, sha256, True)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def _load_state(self) -> dict[str, FileState]:
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, "r") as f:
+            entries = json.load(f)
+        return {os.path.abspath(entry["path"]): FileState(**entry) for entry in entries}
+
+    def _save_state(self) -> None:
+        # Written to a temporary file first so an interrupted save never leaves a truncated state file.
+        with open(self.temp_state_path, "w") as f:
+            json.dump([asdict(state) for state in self.states.values()], f)
+        os.replace(self.temp_state_path, self.state_path)
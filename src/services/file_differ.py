@@ -0,0 +1,139 @@
+import json
+from itertools import zip_longest
+from typing import IO, Iterator
+
+from models.file_diff import FieldChange, TailRecordChange
+from models.fixed_width_file import FixedWidthFile
+from models.transaction import Transaction
+from utils.compression import open_file
+from utils.constraints import FieldLengths
+from utils.exceptions import FileStructureException
+from utils.logger import logger
+from utils.record_layout import RECORD_SLICES, TRANSACTION_SLICES
+
+BLOCK_RECORDS = 512
+_BLOCK_SIZE = BLOCK_RECORDS * FieldLengths.RECORD
+
+
+class FileDiffer:
+    @staticmethod
+    def iter_differences(
+        old_path: str, new_path: str, patch_path: str | None = None
+    ) -> Iterator[FieldChange | TailRecordChange]:
+        if patch_path is None:
+            yield from FileDiffer._iter_differences(old_path, new_path)
+            return
+
+        operations = 0
+        with open(patch_path, "w") as patch_file:
+            for difference in FileDiffer._iter_differences(old_path, new_path):
+                operation = FileDiffer.to_patch_operation(difference)
+                if operation is not None:
+                    patch_file.write(json.dumps(operation) + "\n")
+                    operations += 1
+                yield difference
+        logger.info(f"Patch with {operations} operation(s) written to {patch_path}")
+
+    @staticmethod
+    def _iter_differences(old_path: str, new_path: str) -> Iterator[FieldChange | TailRecordChange]:
+        # Walks both files in lockstep, one block of records at a time; identical blocks are
+        # skipped with a single string comparison, so memory stays bounded by the block size.
+        old_footer: list[str] = []
+        new_footer: list[str] = []
+        with open_file(old_path, "r") as old_file, open_file(new_path, "r") as new_file:
+            old_blocks = FileDiffer._iter_body_blocks(old_file, old_path, old_footer)
+            new_blocks = FileDiffer._iter_body_blocks(new_file, new_path, new_footer)
+
+            position = 0
+            for old_block, new_block in zip_longest(old_blocks, new_blocks, fillvalue=""):
+                block_records = max(len(old_block), len(new_block)) // FieldLengths.RECORD
+                if old_block != new_block:
+                    yield from FileDiffer._diff_block(old_block, new_block, position, block_records)
+                position += block_records
+
+        yield from FileDiffer._diff_record("footer", None, old_footer[0], new_footer[0])
+
+    @staticmethod
+    def _iter_body_blocks(f: IO[str], file_path: str, footer: list[str]) -> Iterator[str]:
+        # Holds back one block so the last record can be split off as the footer.
+        pending = f.read(_BLOCK_SIZE)
+        while pending:
+            following = f.read(_BLOCK_SIZE)
+            if following:
+                yield pending
+                pending = following
+                continue
+
+            if len(pending) % FieldLengths.RECORD:
+                raise FileStructureException(f"File {file_path} is not made of {FieldLengths.RECORD}-character records")
+            footer.append(pending[-FieldLengths.RECORD :])
+            if len(pending) > FieldLengths.RECORD:
+                yield pending[: -FieldLengths.RECORD]
+            return
+        raise FileStructureException(f"File {file_path} is empty")
+
+    @staticmethod
+    def _diff_block(
+        old_block: str, new_block: str, position: int, block_records: int
+    ) -> Iterator[FieldChange | TailRecordChange]:
+        for offset in range(0, block_records * FieldLengths.RECORD, FieldLengths.RECORD):
+            old_record = old_block[offset : offset + FieldLengths.RECORD]
+            new_record = new_block[offset : offset + FieldLengths.RECORD]
+            if old_record == new_record:
+                continue
+
+            record_position = position + offset // FieldLengths.RECORD
+            if record_position == 0:
+                yield from FileDiffer._diff_record("header", None, old_record, new_record)
+            elif not old_record:
+                yield TailRecordChange("inserted", record_position - 1, new_record)
+            elif not new_record:
+                yield TailRecordChange("removed", record_position - 1, old_record)
+            else:
+                yield from FileDiffer._diff_record("transaction", record_position - 1, old_record, new_record)
+
+    @staticmethod
+    def _diff_record(record_type: str, index: int | None, old_record: str, new_record: str) -> Iterator[FieldChange]:
+        for field_name, field_slice in RECORD_SLICES[record_type]:
+            old_value = old_record[field_slice]
+            new_value = new_record[field_slice]
+            if old_value != new_value:
+                yield FieldChange(record_type, index, field_name, old_value, new_value)
+
+    @staticmethod
+    def to_patch_operation(difference: FieldChange | TailRecordChange) -> dict | None:
+        if isinstance(difference, TailRecordChange):
+            if difference.change == "removed":
+                return {"op": "remove", "index": difference.index}
+            fields = {name: difference.record[field_slice] for name, field_slice in TRANSACTION_SLICES}
+            return {"op": "add", **fields}
+        if difference.record_type == "footer":
+            # The footer is derived from the transactions and is rebuilt as the other operations apply.
+            return None
+        return {
+            "op": "set",
+            "field_type": difference.record_type,
+            "field_name": difference.field,
+            "field_value": difference.new_value,
+            "index": difference.index,
+        }
+
+    @staticmethod
+    def apply_patch(fw_file: FixedWidthFile, patch_path: str) -> None:
+        removals: list[int] = []
+        with open(patch_path, "r") as patch_file:
+            for line in patch_file:
+                operation = json.loads(line)
+                op = operation.pop("op")
+                if op == "set":
+                    fw_file.set_field_value(**operation)
+                elif op == "add":
+                    fw_file.add_transaction(Transaction(**operation))
+                elif op == "remove":
+                    removals.append(operation["index"])
+                else:
+                    raise FileStructureException(f"Unknown patch operation: {op}")
+
+        for index in sorted(removals, reverse=True):
+            fw_file.remove_transaction(index)
+        logger.info(f"Patch {patch_path} applied")
@@ -1,30 +1,56 @@
+from decimal import Decimal
+from models.file_source import FileSource
 from models.fixed_width_file import FixedWidthFile
 from models.footer import Footer
 from models.header import Header
 from models.transaction import Transaction
+from utils.compression import detect_compression, open_file
 from utils.constraints import FieldLengths
-from utils.exceptions import FileStructureException, LineLengthException
+from utils.exceptions import FieldValueValidationException, FileStructureException, LineLengthException
+from utils.record_layout import FOOTER_SLICES, HEADER_SLICES, TRANSACTION_SLICES
 
 
 class FileReader:
     @staticmethod
-    def read_file(file_path: str) -> FixedWidthFile:
-        with open(file_path, "r") as f:
+    def read_file(
+        file_path: str, thread_safe: bool = False, compression: str | None = None, trusted: bool = False
+    ) -> FixedWidthFile:
+        if compression is None:
+            compression = detect_compression(file_path)
+        with open_file(file_path, "r", compression=compression) as f:
             lines = f.readlines()
 
         if len(lines) < 3:
             raise FileStructureException("File must contain at least a header, one transaction, and a footer")
 
-        header = FileReader._parse_header(lines[0])
-        transactions = [FileReader._parse_transaction(line) for line in lines[1:-1]]
-        footer = FileReader._parse_footer(lines[-1])
+        if trusted:
+            # Files we wrote ourselves skip the model validate() calls; record length and field ID
+            # are still checked per line, and the footer consistency check still runs.
+            fw_file = FixedWidthFile(
+                header=FileReader._parse_header_trusted(lines[0], line_number=1),
+                transactions=[
+                    FileReader._parse_transaction_trusted(line, line_number=line_number)
+                    for line_number, line in enumerate(lines[1:-1], start=2)
+                ],
+                footer=FileReader._parse_footer_trusted(lines[-1], line_number=len(lines)),
+                thread_safe=thread_safe,
+            )
+        else:
+            header = FileReader._parse_header(lines[0], line_number=1)
+            transactions = [
+                FileReader._parse_transaction(line, line_number=line_number)
+                for line_number, line in enumerate(lines[1:-1], start=2)
+            ]
+            footer = FileReader._parse_footer(lines[-1], line_number=len(lines))
+            fw_file = FixedWidthFile(header=header, transactions=transactions, footer=footer, thread_safe=thread_safe)
 
-        return FixedWidthFile(header=header, transactions=transactions, footer=footer)
+        fw_file.source = FileSource.from_path(file_path, len(lines) - 2, lines[-1], compression)
+        return fw_file
 
     @staticmethod
-    def _extract_fields(line: str, field_lengths: list[int]) -> list[str]:
+    def _extract_fields(line: str, field_lengths: list[int], line_number: int | None = None) -> list[str]:
         if len(line) != FieldLengths.RECORD:
-            raise LineLengthException(FieldLengths.RECORD, len(line))
+            raise LineLengthException(FieldLengths.RECORD, len(line), line_number)
 
         fields = []
         start = 0
@@ -34,9 +60,10 @@ class FileReader:
         return fields
 
     @staticmethod
-    def _parse_header(line: str) -> Header:
+    def _parse_header(line: str, line_number: int | None = None) -> Header:
         field_id, name, surname, patronymic, address = FileReader._extract_fields(
             line=line,
+            line_number=line_number,
             field_lengths=[
                 FieldLengths.FIELD_ID,
                 FieldLengths.NAME,
@@ -45,12 +72,16 @@ class FileReader:
                 FieldLengths.ADDRESS,
             ],
         )
-        return Header(field_id=field_id, name=name, surname=surname, patronymic=patronymic, address=address)
+        try:
+            return Header(field_id=field_id, name=name, surname=surname, patronymic=patronymic, address=address)
+        except FieldValueValidationException as e:
+            raise FieldValueValidationException(e.field_name, e.value, line_number) from e
 
     @staticmethod
-    def _parse_transaction(line: str) -> Transaction:
+    def _parse_transaction(line: str, line_number: int | None = None) -> Transaction:
         field_id, counter, amount, currency = FileReader._extract_fields(
             line=line,
+            line_number=line_number,
             field_lengths=[
                 FieldLengths.FIELD_ID,
                 FieldLengths.COUNTER,
@@ -58,16 +89,60 @@ class FileReader:
                 FieldLengths.CURRENCY,
             ],
         )
-        return Transaction(field_id=field_id, counter=counter, amount=amount, currency=currency)
+        try:
+            return Transaction(field_id=field_id, counter=counter, amount=amount, currency=currency)
+        except FieldValueValidationException as e:
+            raise FieldValueValidationException(e.field_name, e.value, line_number) from e
 
     @staticmethod
-    def _parse_footer(line: str) -> Footer:
+    def _parse_footer(line: str, line_number: int | None = None) -> Footer:
         field_id, total_counter, control_sum = FileReader._extract_fields(
             line=line,
+            line_number=line_number,
             field_lengths=[
                 FieldLengths.FIELD_ID,
                 FieldLengths.TOTAL_COUNTER,
                 FieldLengths.CONTROL_SUM,
             ],
         )
-        return Footer(field_id=field_id, total_counter=total_counter, control_sum=control_sum)
+        try:
+            return Footer(field_id=field_id, total_counter=total_counter, control_sum=control_sum)
+        except FieldValueValidationException as e:
+            raise FieldValueValidationException(e.field_name, e.value, line_number) from e
+
+    @staticmethod
+    def _parse_amount(amount: str) -> Decimal:
+        return Decimal(f"{amount[:-2]}.{amount[-2:]}")
+
+    @staticmethod
+    def _check_record(line: str, line_number: int, field_id: str) -> None:
+        if len(line) != FieldLengths.RECORD:
+            raise LineLengthException(FieldLengths.RECORD, len(line), line_number)
+        if line[: FieldLengths.FIELD_ID] != field_id:
+            raise FieldValueValidationException("Field ID", line[: FieldLengths.FIELD_ID], line_number)
+
+    @staticmethod
+    def _parse_header_trusted(line: str, line_number: int) -> Header:
+        FileReader._check_record(line, line_number, "01")
+        return Header.from_values(*(line[field_slice] for _, field_slice in HEADER_SLICES))
+
+    @staticmethod
+    def _parse_transaction_trusted(line: str, line_number: int) -> Transaction:
+        FileReader._check_record(line, line_number, "02")
+        (_, field_id), (_, counter), (_, amount), (_, currency) = TRANSACTION_SLICES
+        return Transaction.from_values(
+            field_id=line[field_id],
+            counter=int(line[counter]),
+            amount=FileReader._parse_amount(line[amount]),
+            currency=line[currency],
+        )
+
+    @staticmethod
+    def _parse_footer_trusted(line: str, line_number: int) -> Footer:
+        FileReader._check_record(line, line_number, "03")
+        (_, field_id), (_, total_counter), (_, control_sum) = FOOTER_SLICES
+        return Footer.from_values(
+            field_id=line[field_id],
+            total_counter=int(line[total_counter]),
+            control_sum=FileReader._parse_amount(line[control_sum]),
+        )
@@ -0,0 +1,199 @@
+import heapq
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import uuid
+from typing import IO, Iterable, Iterator
+
+from services.file_writer import FileWriter
+from utils.compression import compression_from_extension, open_file
+from utils.constraints import FieldLengths, FieldLimits
+from utils.exceptions import (
+    FieldNotFoundException,
+    FieldValueValidationException,
+    FileStructureException,
+    LineLengthException,
+)
+from utils.logger import logger
+from utils.record_layout import FOOTER_SLICES, TRANSACTION_SLICES
+
+SORT_KEYS: tuple[str, ...] = ("counter", "amount", "currency")
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+# Currencies are stored as their rank so that sorting by the integer sorts alphabetically.
+_CURRENCIES: tuple[str, ...] = tuple(sorted(FieldLimits.VALID_CURRENCIES))
+_CURRENCY_RANKS: dict[str, int] = {currency: rank for rank, currency in enumerate(_CURRENCIES)}
+_COUNTER_SLICE = dict(TRANSACTION_SLICES)["counter"]
+_AMOUNT_SLICE = dict(TRANSACTION_SLICES)["amount"]
+_CURRENCY_SLICE = dict(TRANSACTION_SLICES)["currency"]
+_TOTAL_COUNTER_SLICE = dict(FOOTER_SLICES)["total_counter"]
+_CONTROL_SUM_SLICE = dict(FOOTER_SLICES)["control_sum"]
+_MIN_RUN_RECORDS = 1024
+
+
+class FileSorter:
+    # Transactions are held as compact integer tuples (sort keys..., position, amount, currency rank).
+    # Position (negated when sorting in reverse) keeps the sort stable and makes every tuple unique,
+    # so the payload is never compared.
+    @staticmethod
+    def sort_file(
+        input_path: str,
+        output_path: str,
+        keys: tuple[str, ...] = ("counter",),
+        reverse: bool = False,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+    ) -> int:
+        for key in keys:
+            if key not in SORT_KEYS:
+                raise FieldNotFoundException(f"transaction.{key}")
+
+        record_struct = struct.Struct(f"<{len(keys) + 3}q")
+        record_cost = FileSorter._record_cost(len(keys) + 3)
+        buffer_records = max(_MIN_RUN_RECORDS, memory_budget // record_cost)
+
+        with tempfile.TemporaryDirectory() as run_dir:
+            with open_file(input_path, "r") as f:
+                header = f.readline()
+                if not header:
+                    raise FileStructureException("File must contain at least a header, one transaction, and a footer")
+                FileSorter._check_record(header, 1, "01")
+                footer: list[str] = []
+                buffer: list[tuple[int, ...]] = []
+                runs: list[str] = []
+                count = 0
+                control_sum = 0
+                for record in FileSorter._iter_records(f, keys, reverse, footer):
+                    count += 1
+                    control_sum += record[-2]
+                    buffer.append(record)
+                    if len(buffer) >= buffer_records:
+                        runs.append(FileSorter._write_run(buffer, run_dir, len(runs), record_struct, reverse))
+                        buffer = []
+            FileSorter._check_footer(footer[0], count + 2, count, control_sum)
+
+            if runs:
+                if buffer:
+                    runs.append(FileSorter._write_run(buffer, run_dir, len(runs), record_struct, reverse))
+                    buffer = []
+                logger.info(f"Sorting {input_path} with an external merge of {len(runs)} runs")
+                run_files = [open(run, "rb") for run in runs]
+                try:
+                    # The merge buffers an equal share of the budget from every run.
+                    read_records = max(1, buffer_records // len(runs))
+                    readers = [FileSorter._read_run(run_file, record_struct, read_records) for run_file in run_files]
+                    count = FileSorter._write_sorted(output_path, header, heapq.merge(*readers, reverse=reverse))
+                finally:
+                    for run_file in run_files:
+                        run_file.close()
+            else:
+                buffer.sort(reverse=reverse)
+                count = FileSorter._write_sorted(output_path, header, buffer)
+
+        logger.info(f"Sorted {count} transactions from {input_path} by {', '.join(keys)} into {output_path}")
+        return count
+
+    @staticmethod
+    def _record_cost(fields: int) -> int:
+        # Tuple object, list slot and one int object per field; small ints are shared, so this overestimates.
+        return sys.getsizeof(tuple(range(fields))) + 8 + fields * sys.getsizeof(2**40)
+
+    @staticmethod
+    def _iter_records(f: IO[str], keys: tuple[str, ...], reverse: bool, footer: list[str]) -> Iterator[tuple[int, ...]]:
+        # Yields every line except the last one, which is the footer and is handed back through `footer`.
+        previous_line = f.readline()
+        line_number = 2
+        for line in f:
+            yield FileSorter._to_record(previous_line, line_number, keys, -line_number if reverse else line_number)
+            previous_line = line
+            line_number += 1
+        if line_number == 2:
+            raise FileStructureException("File must contain at least a header, one transaction, and a footer")
+        footer.append(previous_line)
+
+    @staticmethod
+    def _check_record(line: str, line_number: int, field_id: str) -> None:
+        if len(line) != FieldLengths.RECORD:
+            raise LineLengthException(FieldLengths.RECORD, len(line), line_number)
+        if line[: FieldLengths.FIELD_ID] != field_id:
+            raise FieldValueValidationException(field_name="Field ID", value=line[: FieldLengths.FIELD_ID])
+
+    @staticmethod
+    def _check_footer(line: str, line_number: int, count: int, control_sum: int) -> None:
+        # The footer is rebuilt on output, so a footer that disagrees with the records is rejected
+        # rather than silently repaired.
+        FileSorter._check_record(line, line_number, "03")
+        total_counter = line[_TOTAL_COUNTER_SLICE]
+        if not (total_counter.isascii() and total_counter.isdigit()) or int(total_counter) != count:
+            raise FieldValueValidationException(field_name="Total counter", value=total_counter)
+        footer_sum = line[_CONTROL_SUM_SLICE]
+        if not (footer_sum.isascii() and footer_sum.isdigit()) or int(footer_sum) != control_sum:
+            raise FieldValueValidationException(field_name="Control sum", value=footer_sum)
+
+    @staticmethod
+    def _to_record(line: str, line_number: int, keys: tuple[str, ...], position: int) -> tuple[int, ...]:
+        FileSorter._check_record(line, line_number, "02")
+        counter = line[_COUNTER_SLICE]
+        amount = line[_AMOUNT_SLICE]
+        currency = line[_CURRENCY_SLICE]
+        if not (counter.isascii() and counter.isdigit()):
+            raise FieldValueValidationException(field_name="Counter", value=counter)
+        if not (amount.isascii() and amount.isdigit()):
+            raise FieldValueValidationException(field_name="Amount", value=amount)
+        if currency not in _CURRENCY_RANKS:
+            raise FieldValueValidationException(field_name="Currency", value=currency)
+
+        values = {"counter": int(counter), "amount": int(amount), "currency": _CURRENCY_RANKS[currency]}
+        return (*(values[key] for key in keys), position, values["amount"], values["currency"])
+
+    @staticmethod
+    def _write_run(
+        buffer: list[tuple[int, ...]], run_dir: str, run_index: int, record_struct: struct.Struct, reverse: bool
+    ) -> str:
+        buffer.sort(reverse=reverse)
+        run_path = os.path.join(run_dir, f"run_{run_index}.bin")
+        with open(run_path, "wb") as run_file:
+            run_file.write(b"".join(record_struct.pack(*record) for record in buffer))
+        logger.debug(f"Sorted run {run_index} with {len(buffer)} transactions written to {run_path}")
+        return run_path
+
+    @staticmethod
+    def _read_run(run_file: IO[bytes], record_struct: struct.Struct, read_records: int) -> Iterator[tuple[int, ...]]:
+        while chunk := run_file.read(record_struct.size * read_records):
+            yield from record_struct.iter_unpack(chunk)
+
+    @staticmethod
+    def _write_sorted(output_path: str, header: str, records: Iterable[tuple[int, ...]]) -> int:
+        # Renumbers counters and accumulates the footer totals while the sorted stream is written out.
+        # Output goes to a temporary file in the target directory that replaces the target only once
+        # complete, so a failure partway through never destroys the original when sorting in place.
+        output_dir, output_name = os.path.split(os.path.abspath(output_path))
+        temp_path = os.path.join(output_dir, f".{output_name}.{uuid.uuid4().hex}.tmp")
+        try:
+            counter = FieldLimits.MIN_COUNTER - 1
+            control_sum = 0
+            with open_file(temp_path, "w", compression=compression_from_extension(output_path)) as f:
+                f.write(header)
+                for record in records:
+                    amount, currency = record[-2], record[-1]
+                    counter += 1
+                    control_sum += amount
+                    f.write(FileWriter.format_transaction_record("02", counter, amount, _CURRENCIES[currency]))
+                count = counter - FieldLimits.MIN_COUNTER + 1
+                f.write(FileWriter.format_footer_record("03", count, control_sum))
+
+            # Synced after closing so compressed output is fully flushed by its codec first.
+            fd = os.open(temp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            if os.path.exists(output_path):
+                shutil.copymode(output_path, temp_path)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return count
@@ -0,0 +1,150 @@
+from models.validation_report import ValidationReport
+from utils.compression import open_file
+from utils.constraints import FieldLengths, FieldLimits
+from utils.record_layout import FOOTER_SLICES, HEADER_SLICES, TRANSACTION_SLICES
+
+_VALID_CURRENCIES = frozenset(FieldLimits.VALID_CURRENCIES)
+_COUNTER_SLICE = dict(TRANSACTION_SLICES)["counter"]
+_AMOUNT_SLICE = dict(TRANSACTION_SLICES)["amount"]
+_CURRENCY_SLICE = dict(TRANSACTION_SLICES)["currency"]
+_TOTAL_COUNTER_SLICE = dict(FOOTER_SLICES)["total_counter"]
+_CONTROL_SUM_SLICE = dict(FOOTER_SLICES)["control_sum"]
+_FIELD_ID_SLICE = slice(0, FieldLengths.FIELD_ID)
+
+
+def _is_number(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+class FileValidator:
+    # Collects every problem in one pass instead of stopping at the first exception.
+    # Rules mirror the model classes, but numeric fields must be plain digits as written by FileWriter.
+    @staticmethod
+    def validate_file(
+        file_path: str, max_errors: int | None = None, compression: str | None = None
+    ) -> ValidationReport:
+        report = ValidationReport(file_path=file_path, max_errors=max_errors)
+
+        with open_file(file_path, "r", compression=compression) as f:
+            header_line = f.readline()
+            previous_line = f.readline()
+            if not header_line or not previous_line:
+                report.add_issue(0, "file", "structure", "", "must contain a header, transactions and a footer")
+                return report
+            FileValidator._check_header(header_line, 1, report)
+
+            line_number = 2
+            transaction_count = 0
+            amounts_sum: int | None = 0
+            for line in f:
+                if report.is_full:
+                    report.truncated = True
+                    report.lines_checked = line_number - 1
+                    return report
+                amount = FileValidator._check_transaction(previous_line, line_number, report)
+                if amount is None or amounts_sum is None:
+                    amounts_sum = None
+                else:
+                    amounts_sum += amount
+                transaction_count += 1
+                previous_line = line
+                line_number += 1
+
+        if transaction_count == 0:
+            report.add_issue(0, "file", "structure", "", "must contain a header, transactions and a footer")
+        FileValidator._check_footer(previous_line, line_number, transaction_count, amounts_sum, report)
+        report.lines_checked = line_number
+        return report
+
+    @staticmethod
+    def _check_length(line: str, line_number: int, record_type: str, report: ValidationReport) -> bool:
+        if len(line) == FieldLengths.RECORD:
+            return True
+        report.add_issue(line_number, record_type, "record", str(len(line)), f"length must be {FieldLengths.RECORD}")
+        return False
+
+    @staticmethod
+    def _check_field_id(line: str, line_number: int, record_type: str, expected: str, report: ValidationReport) -> None:
+        field_id = line[_FIELD_ID_SLICE]
+        if field_id != expected:
+            report.add_issue(line_number, record_type, "field_id", field_id, f"must be {expected}")
+
+    @staticmethod
+    def _check_counter(
+        value: str, line_number: int, record_type: str, field_name: str, report: ValidationReport
+    ) -> int | None:
+        if not _is_number(value):
+            report.add_issue(line_number, record_type, field_name, value, "must be numeric")
+            return None
+        counter = int(value)
+        if not FieldLimits.MIN_COUNTER <= counter <= FieldLimits.MAX_COUNTER:
+            report.add_issue(
+                line_number,
+                record_type,
+                field_name,
+                value,
+                f"must be between {FieldLimits.MIN_COUNTER} and {FieldLimits.MAX_COUNTER}",
+            )
+        return counter
+
+    @staticmethod
+    def _check_header(line: str, line_number: int, report: ValidationReport) -> None:
+        if not FileValidator._check_length(line, line_number, "header", report):
+            return
+        FileValidator._check_field_id(line, line_number, "header", "01", report)
+        for field_name, field_slice in HEADER_SLICES[1:]:
+            value = line[field_slice]
+            if not value.strip():
+                report.add_issue(line_number, "header", field_name, value, "must not be blank")
+
+    @staticmethod
+    def _check_transaction(line: str, line_number: int, report: ValidationReport) -> int | None:
+        if not FileValidator._check_length(line, line_number, "transaction", report):
+            return None
+        FileValidator._check_field_id(line, line_number, "transaction", "02", report)
+        FileValidator._check_counter(line[_COUNTER_SLICE], line_number, "transaction", "counter", report)
+
+        currency = line[_CURRENCY_SLICE]
+        if currency not in _VALID_CURRENCIES:
+            report.add_issue(
+                line_number, "transaction", "currency", currency, f"must be one of {FieldLimits.VALID_CURRENCIES}"
+            )
+
+        amount = line[_AMOUNT_SLICE]
+        if not _is_number(amount):
+            report.add_issue(line_number, "transaction", "amount", amount, "must be numeric")
+            return None
+        return int(amount)
+
+    @staticmethod
+    def _check_footer(
+        line: str, line_number: int, transaction_count: int, amounts_sum: int | None, report: ValidationReport
+    ) -> None:
+        if not FileValidator._check_length(line, line_number, "footer", report):
+            return
+        FileValidator._check_field_id(line, line_number, "footer", "03", report)
+
+        total_counter_value = line[_TOTAL_COUNTER_SLICE]
+        total_counter = FileValidator._check_counter(
+            total_counter_value, line_number, "footer", "total_counter", report
+        )
+        if total_counter is not None and total_counter != transaction_count:
+            report.add_issue(
+                line_number,
+                "footer",
+                "total_counter",
+                total_counter_value,
+                f"must equal transaction count {transaction_count}",
+            )
+
+        control_sum = line[_CONTROL_SUM_SLICE]
+        if not _is_number(control_sum):
+            report.add_issue(line_number, "footer", "control_sum", control_sum, "must be numeric")
+        elif amounts_sum is not None and int(control_sum) != amounts_sum:
+            report.add_issue(
+                line_number,
+                "footer",
+                "control_sum",
+                control_sum,
+                f"must equal sum of transaction amounts {amounts_sum:0>{FieldLengths.CONTROL_SUM}}",
+            )
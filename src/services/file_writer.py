@@ -1,18 +1,103 @@
+import os
+from models.file_source import FileSource
 from models.fixed_width_file import FixedWidthFile
 from models.footer import Footer
 from models.header import Header
 from models.transaction import Transaction
+from utils.compression import compression_from_extension, detect_compression, open_file
 from utils.constraints import FieldLengths
+from utils.logger import logger
 
 
 class FileWriter:
     @staticmethod
-    def write_file(file_path: str, fw_file: FixedWidthFile):
-        with open(file_path, "w") as f:
-            f.write(FileWriter._format_header(fw_file.header))
-            for transaction in fw_file.transactions:
-                f.write(FileWriter._format_transaction(transaction))
-            f.write(FileWriter._format_footer(fw_file.footer))
+    def write_file(
+        file_path: str, fw_file: FixedWidthFile, compression: str | None = None, compression_level: int | None = None
+    ):
+        with fw_file.lock.read_lock():
+            records = FileWriter._format_records(fw_file)
+            compression = FileWriter._resolve_compression(file_path, fw_file, compression)
+        with open_file(file_path, "w", compression=compression, compression_level=compression_level) as f:
+            f.writelines(records)
+
+    @staticmethod
+    def save_file(file_path: str, fw_file: FixedWidthFile) -> bool:
+        # When the only change since load is appended transactions, rewrites just the footer
+        # and the new records instead of the whole file. Returns True if that path was taken.
+        with fw_file.lock.write_lock():
+            source = fw_file.source
+            appended = (
+                source is not None
+                and FileWriter._can_append(file_path, fw_file, source)
+                and FileWriter._append_transactions(file_path, fw_file, source)
+            )
+            compression = FileWriter._resolve_compression(file_path, fw_file, None)
+            if not appended:
+                records = FileWriter._format_records(fw_file)
+                with open_file(file_path, "w", compression=compression) as f:
+                    f.writelines(records)
+
+            fw_file.source = FileSource.from_path(
+                file_path,
+                len(fw_file.transactions),
+                FileWriter._format_footer(fw_file.footer),
+                None if appended else compression or compression_from_extension(file_path),
+            )
+            fw_file.modified = False
+        return appended
+
+    @staticmethod
+    def _resolve_compression(file_path: str, fw_file: FixedWidthFile, compression: str | None) -> str | None:
+        # Writing back over the loaded file keeps the compression it was read with, even when the
+        # name carries no compression extension; otherwise open_file falls back to the extension.
+        source = fw_file.source
+        if compression is None and source is not None and source.path == os.path.abspath(file_path):
+            return source.compression
+        return compression
+
+    @staticmethod
+    def _can_append(file_path: str, fw_file: FixedWidthFile, source: FileSource) -> bool:
+        return (
+            not fw_file.modified
+            and source.path == os.path.abspath(file_path)
+            and len(fw_file.transactions) >= source.transaction_count
+            and os.path.exists(file_path)
+            and source.compression is None
+            and detect_compression(file_path) is None
+        )
+
+    @staticmethod
+    def _append_transactions(file_path: str, fw_file: FixedWidthFile, source: FileSource) -> bool:
+        records = [FileWriter._format_transaction(t) for t in fw_file.transactions[source.transaction_count :]]
+        records.append(FileWriter._format_footer(fw_file.footer))
+
+        with open(file_path, "r+b") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size != source.size or stat.st_mtime_ns != source.mtime_ns:
+                logger.warning(f"File {file_path} changed on disk since load, rewriting it in full")
+                return False
+
+            footer_offset = stat.st_size - FieldLengths.RECORD
+            f.seek(footer_offset)
+            if f.read(FieldLengths.RECORD) != source.footer_record.encode():
+                logger.warning(f"Footer of {file_path} changed on disk since load, rewriting it in full")
+                return False
+
+            f.seek(footer_offset)
+            f.truncate()
+            f.write("".join(records).encode())
+            f.flush()
+            os.fsync(f.fileno())
+
+        logger.info(f"Appended {len(records) - 1} transaction(s) to {file_path}")
+        return True
+
+    @staticmethod
+    def _format_records(fw_file: FixedWidthFile) -> list[str]:
+        records = [FileWriter._format_header(fw_file.header)]
+        records.extend(FileWriter._format_transaction(transaction) for transaction in fw_file.transactions)
+        records.append(FileWriter._format_footer(fw_file.footer))
+        return records
 
     @staticmethod
     def _format_header(header: Header) -> str:
@@ -26,19 +111,31 @@ class FileWriter:
 
     @staticmethod
     def _format_transaction(transaction: Transaction) -> str:
+        return FileWriter.format_transaction_record(
+            transaction.field_id, transaction.counter, str(transaction.amount).replace(".", ""), transaction.currency
+        )
+
+    @staticmethod
+    def format_transaction_record(field_id: str, counter: int | str, amount: int | str, currency: str) -> str:
         return (
-            f"{transaction.field_id:<{FieldLengths.FIELD_ID}}"
-            f"{transaction.counter:0>{FieldLengths.COUNTER}}"
-            f"{str(transaction.amount).replace('.', ''):0>{FieldLengths.AMOUNT}}"
-            f"{transaction.currency:<{FieldLengths.CURRENCY}}"
+            f"{field_id:<{FieldLengths.FIELD_ID}}"
+            f"{counter:0>{FieldLengths.COUNTER}}"
+            f"{amount:0>{FieldLengths.AMOUNT}}"
+            f"{currency:<{FieldLengths.CURRENCY}}"
             f"{'':<{FieldLengths.TRANSACTION_RESERVED}}\n"
         )
 
     @staticmethod
     def _format_footer(footer: Footer) -> str:
+        return FileWriter.format_footer_record(
+            footer.field_id, footer.total_counter, str(footer.control_sum).replace(".", "")
+        )
+
+    @staticmethod
+    def format_footer_record(field_id: str, total_counter: int | str, control_sum: int | str) -> str:
         return (
-            f"{footer.field_id:<{FieldLengths.FIELD_ID}}"
-            f"{footer.total_counter:0>{FieldLengths.TOTAL_COUNTER}}"
-            f"{str(footer.control_sum).replace('.', ''):0>{FieldLengths.CONTROL_SUM}}"
+            f"{field_id:<{FieldLengths.FIELD_ID}}"
+            f"{total_counter:0>{FieldLengths.TOTAL_COUNTER}}"
+            f"{control_sum:0>{FieldLengths.CONTROL_SUM}}"
             f"{'':<{FieldLengths.FOOTER_RESERVED}}"
         )
@@ -1,10 +1,14 @@
 import logging
+from typing import Any, Callable
+
 import pytest
 
 from models.transaction import Transaction
 from models.fixed_width_file import FixedWidthFile
 from models.footer import Footer
 from models.header import Header
+from services.file_writer import FileWriter
+from utils.constraints import FieldLengths
 
 
 @pytest.fixture(autouse=True)
@@ -36,3 +40,56 @@ def sample_footer(sample_transactions) -> Footer:
 @pytest.fixture(scope="function")
 def fixed_width_file(sample_header, sample_transactions, sample_footer) -> FixedWidthFile:
     return FixedWidthFile(sample_header, sample_transactions, sample_footer)
+
+
+def sample_file_lines(
+    transactions: list[tuple[int, str]],
+    name: str = "John",
+    surname: str = "Smith",
+    patronymic: str = "Alexander",
+    address: str = "Main St",
+    total_counter: int | None = None,
+    control_sum: int | None = None,
+) -> list[str]:
+    # Amounts are in cents; the footer is derived from the transactions unless overridden.
+    # The header's trailing newline is the last character of its address field.
+    lines = [
+        f"{'01':<{FieldLengths.FIELD_ID}}{name:<{FieldLengths.NAME}}{surname:<{FieldLengths.SURNAME}}"
+        f"{patronymic:<{FieldLengths.PATRONYMIC}}{address:<{FieldLengths.ADDRESS - 1}}\n"
+    ]
+    lines.extend(
+        FileWriter.format_transaction_record("02", counter, amount, currency)
+        for counter, (amount, currency) in enumerate(transactions, start=1)
+    )
+    lines.append(
+        FileWriter.format_footer_record(
+            "03",
+            len(transactions) if total_counter is None else total_counter,
+            sum(amount for amount, _ in transactions) if control_sum is None else control_sum,
+        )
+    )
+    return lines
+
+
+@pytest.fixture(scope="function")
+def write_sample_file(tmp_path) -> Callable[..., str]:
+    # Raw `replace_lines`, keyed by 1-based line number, let tests plant malformed records.
+    def write(
+        transactions: list[tuple[int, str]],
+        file_name: str = "sample.txt",
+        replace_lines: dict[int, str] | None = None,
+        **fields: Any,
+    ) -> str:
+        lines = sample_file_lines(transactions, **fields)
+        for line_number, line in (replace_lines or {}).items():
+            lines[line_number - 1] = line
+        file_path = tmp_path / file_name
+        file_path.write_text("".join(lines))
+        return str(file_path)
+
+    return write
+
+
+@pytest.fixture(scope="function")
+def sample_file_path(write_sample_file) -> str:
+    return write_sample_file([(1500, "USD"), (2750, "EUR")])
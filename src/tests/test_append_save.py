@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+
+from models.transaction import Transaction
+from services.file_reader import FileReader
+from services.file_writer import FileWriter
+
+
+def test_append_only_save_matches_full_write(sample_file_path: str, tmp_path):
+    fw_file = FileReader.read_file(sample_file_path)
+    fw_file.add_transaction(Transaction("02", "000003", "000000000100", "GBP"))
+
+    assert FileWriter.save_file(sample_file_path, fw_file)
+
+    full_path = str(tmp_path / "full.txt")
+    FileWriter.write_file(full_path, fw_file)
+    assert Path(sample_file_path).read_bytes() == Path(full_path).read_bytes()
+    assert FileReader.read_file(sample_file_path).footer.total_counter == 3
+
+
+def test_repeated_append_only_saves(sample_file_path: str):
+    fw_file = FileReader.read_file(sample_file_path)
+    for counter in (3, 4):
+        fw_file.add_transaction(Transaction("02", f"{counter:06d}", "000000000100", "USD"))
+        assert FileWriter.save_file(sample_file_path, fw_file)
+
+    assert len(FileReader.read_file(sample_file_path).transactions) == 4
+
+
+def test_edited_file_is_rewritten_in_full(sample_file_path: str):
+    fw_file = FileReader.read_file(sample_file_path)
+    fw_file.set_field_value("transaction", "amount", "000000003000", 0)
+    fw_file.add_transaction(Transaction("02", "000003", "000000000100", "USD"))
+
+    assert not FileWriter.save_file(sample_file_path, fw_file)
+
+    saved = FileReader.read_file(sample_file_path)
+    assert saved.footer.control_sum == fw_file.footer.control_sum
+    assert not fw_file.modified
+
+
+def test_file_changed_on_disk_is_rewritten_in_full(sample_file_path: str):
+    fw_file = FileReader.read_file(sample_file_path)
+    fw_file.add_transaction(Transaction("02", "000003", "000000000100", "USD"))
+    stat = os.stat(sample_file_path)
+    os.utime(sample_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert not FileWriter.save_file(sample_file_path, fw_file)
+    assert len(FileReader.read_file(sample_file_path).transactions) == 3
+
+
+def test_save_to_other_path_is_written_in_full(sample_file_path: str, tmp_path):
+    fw_file = FileReader.read_file(sample_file_path)
+    other_path = str(tmp_path / "other.txt")
+
+    assert not FileWriter.save_file(other_path, fw_file)
+    assert Path(other_path).read_bytes() == Path(sample_file_path).read_bytes()
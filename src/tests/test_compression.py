@@ -0,0 +1,55 @@
+import pytest
+
+from models.transaction import Transaction
+from services.file_reader import FileReader
+from services.file_writer import FileWriter
+from utils.compression import detect_compression
+from utils.exceptions import UnsupportedCompressionException
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_compressed_round_trip(sample_file_path: str, tmp_path, compression: str):
+    fw_file = FileReader.read_file(sample_file_path)
+    compressed_path = str(tmp_path / "archived.dat")
+
+    FileWriter.write_file(compressed_path, fw_file, compression=compression, compression_level=1)
+
+    assert detect_compression(compressed_path) == compression
+    restored = FileReader.read_file(compressed_path)
+    assert restored.footer.control_sum == fw_file.footer.control_sum
+    assert [t.amount for t in restored.transactions] == [t.amount for t in fw_file.transactions]
+
+
+@pytest.mark.parametrize("extension, compression", [(".gz", "gzip"), (".bz2", "bz2"), (".xz", "xz")])
+def test_compression_inferred_from_extension(sample_file_path: str, tmp_path, extension: str, compression: str):
+    compressed_path = str(tmp_path / f"archived.txt{extension}")
+
+    FileWriter.write_file(compressed_path, FileReader.read_file(sample_file_path))
+
+    assert detect_compression(compressed_path) == compression
+
+
+@pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+def test_save_in_place_keeps_detected_compression(sample_file_path: str, tmp_path, compression: str):
+    archive_path = str(tmp_path / "archive.dat")
+    FileWriter.write_file(archive_path, FileReader.read_file(sample_file_path), compression=compression)
+    fw_file = FileReader.read_file(archive_path)
+    fw_file.add_transaction(Transaction("02", "000003", "000000000100", "USD"))
+
+    assert not FileWriter.save_file(archive_path, fw_file)
+
+    assert detect_compression(archive_path) == compression
+    assert FileReader.read_file(archive_path).footer.total_counter == 3
+
+    FileWriter.write_file(archive_path, fw_file)
+
+    assert detect_compression(archive_path) == compression
+
+
+def test_plain_file_is_not_detected_as_compressed(sample_file_path: str):
+    assert detect_compression(sample_file_path) is None
+
+
+def test_unsupported_compression(sample_file_path: str, tmp_path):
+    with pytest.raises(UnsupportedCompressionException):
+        FileWriter.write_file(str(tmp_path / "out.zst"), FileReader.read_file(sample_file_path), compression="zstd")
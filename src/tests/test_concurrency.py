@@ -0,0 +1,72 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from models.transaction import Transaction
+from services.file_reader import FileReader
+from services.file_writer import FileWriter
+from utils.rw_lock import ReadWriteLock
+
+
+def test_readers_do_not_block_each_other():
+    lock = ReadWriteLock()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def reader() -> None:
+        with lock.read_lock():
+            barrier.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+
+
+def test_writer_excludes_readers():
+    lock = ReadWriteLock()
+    reader_entered = threading.Event()
+
+    def reader() -> None:
+        with lock.read_lock():
+            reader_entered.set()
+
+    with lock.write_lock():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        assert not reader_entered.wait(timeout=0.1)
+
+    thread.join()
+    assert reader_entered.is_set()
+
+
+def test_concurrent_edits_keep_footer_consistent(sample_file_path: str, tmp_path):
+    fw_file = FileReader.read_file(sample_file_path, thread_safe=True)
+    snapshots: list[str] = []
+
+    def edit(task: int) -> None:
+        rng = random.Random(task)
+        action = task % 4
+        if action == 0:
+            fw_file.add_transaction(Transaction("02", f"{task + 3:06d}", f"{rng.randint(0, 99999):012d}", "USD"))
+        elif action in (1, 2):
+            with fw_file.lock.read_lock():
+                index = rng.randrange(len(fw_file.transactions))
+            fw_file.set_field_value("transaction", "amount", f"{rng.randint(0, 99999):012d}", index)
+        else:
+            snapshot_path = str(tmp_path / f"snapshot_{task}.txt")
+            FileWriter.write_file(snapshot_path, fw_file)
+            snapshots.append(snapshot_path)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(edit, range(2000)))
+
+    fw_file.validate()
+    assert fw_file.footer.total_counter == len(fw_file.transactions) == 2 + 500
+    assert fw_file.footer.control_sum == sum((t.amount for t in fw_file.transactions), Decimal("0"))
+
+    for snapshot_path in snapshots:
+        FileReader.read_file(snapshot_path).validate()
@@ -0,0 +1,110 @@
+import os
+import shutil
+
+from services.directory_watcher import DirectoryWatcher
+from services.file_reader import FileReader
+
+
+def _landing_dir(tmp_path, sample_file_path: str) -> str:
+    landing_dir = tmp_path / "landing"
+    landing_dir.mkdir()
+    shutil.copy(sample_file_path, landing_dir / "good.txt")
+    (landing_dir / "bad.txt").write_text("not a fixed width file\n")
+    return str(landing_dir)
+
+
+def test_first_poll_validates_every_file(tmp_path, sample_file_path: str):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    watcher = DirectoryWatcher(landing_dir)
+
+    results = {os.path.basename(state.path): state for state in watcher.poll()}
+
+    assert results["good.txt"].valid
+    assert not results["bad.txt"].valid
+    bad_error = results["bad.txt"].error
+    assert bad_error is not None
+    assert "FileStructureException" in bad_error
+    assert list(watcher.poll()) == []
+
+
+def test_state_persists_between_watchers(tmp_path, sample_file_path: str):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    list(DirectoryWatcher(landing_dir).poll())
+
+    watcher = DirectoryWatcher(landing_dir)
+
+    assert list(watcher.poll()) == []
+    assert len(watcher.states) == 2
+
+
+def test_only_new_or_modified_files_are_validated(tmp_path, sample_file_path: str, monkeypatch):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    watcher = DirectoryWatcher(landing_dir, max_workers=2)
+    list(watcher.poll())
+
+    validated = []
+    read_file = FileReader.read_file
+
+    def counting_read_file(file_path: str, *args, **kwargs):
+        validated.append(os.path.basename(file_path))
+        return read_file(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(FileReader, "read_file", counting_read_file)
+    shutil.copy(sample_file_path, os.path.join(landing_dir, "new.txt"))
+    with open(os.path.join(landing_dir, "bad.txt"), "a") as f:
+        f.write("still broken\n")
+    good_path = os.path.join(landing_dir, "good.txt")
+    stat = os.stat(good_path)
+    os.utime(good_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    results = {os.path.basename(state.path): state for state in watcher.poll()}
+
+    assert sorted(validated) == ["bad.txt", "new.txt"]
+    assert set(results) == {"bad.txt", "good.txt", "new.txt"}
+    assert results["good.txt"].valid and results["new.txt"].valid
+
+
+def test_removed_files_leave_the_state(tmp_path, sample_file_path: str):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    watcher = DirectoryWatcher(landing_dir)
+    list(watcher.poll())
+
+    os.remove(os.path.join(landing_dir, "bad.txt"))
+    list(watcher.poll())
+
+    assert [os.path.basename(path) for path in DirectoryWatcher(landing_dir).states] == ["good.txt"]
+
+
+def test_leftover_temp_state_file_is_ignored(tmp_path, sample_file_path: str):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    watcher = DirectoryWatcher(landing_dir)
+    list(watcher.poll())
+    shutil.copy(watcher.state_path, watcher.temp_state_path)
+
+    assert list(watcher.poll()) == []
+
+
+def test_state_is_keyed_on_absolute_paths(tmp_path, sample_file_path: str, monkeypatch):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    monkeypatch.chdir(tmp_path)
+    list(DirectoryWatcher("landing").poll())
+
+    assert list(DirectoryWatcher(landing_dir).poll()) == []
+
+
+def test_file_removed_between_scan_and_check_is_dropped(tmp_path, sample_file_path: str, monkeypatch):
+    landing_dir = _landing_dir(tmp_path, sample_file_path)
+    watcher = DirectoryWatcher(landing_dir)
+    list(watcher.poll())
+    shutil.copy(sample_file_path, os.path.join(landing_dir, "moved.txt"))
+    scan = watcher._scan
+
+    def scan_then_move():
+        result = scan()
+        os.remove(os.path.join(landing_dir, "moved.txt"))
+        return result
+
+    monkeypatch.setattr(watcher, "_scan", scan_then_move)
+
+    assert list(watcher.poll()) == []
+    assert sorted(os.path.basename(path) for path in watcher.states) == ["bad.txt", "good.txt"]
@@ -0,0 +1,72 @@
+from models.file_diff import FieldChange, TailRecordChange
+from services.file_differ import BLOCK_RECORDS, FileDiffer
+from services.file_reader import FileReader
+from services.file_writer import FileWriter
+
+
+def test_identical_files_have_no_differences(write_sample_file):
+    old_path = write_sample_file([(1500, "USD"), (2750, "USD")], "old.txt")
+    new_path = write_sample_file([(1500, "USD"), (2750, "USD")], "new.txt")
+
+    assert list(FileDiffer.iter_differences(old_path, new_path)) == []
+
+
+def test_reports_changed_fields(write_sample_file):
+    old_path = write_sample_file([(1500, "USD"), (2750, "USD")], "old.txt")
+    new_path = write_sample_file([(1500, "USD"), (3000, "USD")], "new.txt", name="Jane")
+
+    differences = list(FileDiffer.iter_differences(old_path, new_path))
+
+    assert [(d.record_type, d.index, d.field) for d in differences] == [
+        ("header", None, "name"),
+        ("transaction", 1, "amount"),
+        ("footer", None, "control_sum"),
+    ]
+    assert differences[1] == FieldChange("transaction", 1, "amount", "000000002750", "000000003000")
+
+
+def test_skips_identical_blocks_and_reports_index(write_sample_file):
+    transactions = [(100, "USD")] * (BLOCK_RECORDS * 3)
+    old_path = write_sample_file(transactions, "old.txt")
+    transactions[BLOCK_RECORDS * 2 + 5] = (200, "USD")
+    new_path = write_sample_file(transactions, "new.txt")
+
+    differences = list(FileDiffer.iter_differences(old_path, new_path))
+
+    assert [(d.record_type, d.index) for d in differences] == [
+        ("transaction", BLOCK_RECORDS * 2 + 5),
+        ("footer", None),
+    ]
+
+
+def test_reports_tail_records(write_sample_file):
+    old_path = write_sample_file([(1500, "USD"), (2750, "USD")], "old.txt")
+    new_path = write_sample_file([(1500, "USD"), (2750, "USD"), (100, "USD"), (200, "USD")], "new.txt")
+
+    inserted = [d for d in FileDiffer.iter_differences(old_path, new_path) if isinstance(d, TailRecordChange)]
+    removed = [d for d in FileDiffer.iter_differences(new_path, old_path) if isinstance(d, TailRecordChange)]
+
+    assert [(d.change, d.index) for d in inserted] == [("inserted", 2), ("inserted", 3)]
+    assert [(d.change, d.index) for d in removed] == [("removed", 2), ("removed", 3)]
+
+
+def test_patch_round_trip(tmp_path, write_sample_file):
+    old_path = write_sample_file([(1500, "USD"), (2750, "USD"), (100, "USD")], "old.txt")
+    new_path = write_sample_file(
+        [(1500, "USD"), (3000, "USD"), (100, "USD"), (400, "USD"), (500, "USD")], "new.txt", name="Jane"
+    )
+    patch_path = str(tmp_path / "changes.patch")
+
+    list(FileDiffer.iter_differences(old_path, new_path, patch_path))
+    fw_file = FileReader.read_file(old_path)
+    FileDiffer.apply_patch(fw_file, patch_path)
+    patched_path = str(tmp_path / "patched.txt")
+    FileWriter.write_file(patched_path, fw_file)
+
+    assert list(FileDiffer.iter_differences(patched_path, new_path)) == []
+
+    list(FileDiffer.iter_differences(new_path, old_path, patch_path))
+    FileDiffer.apply_patch(fw_file, patch_path)
+    FileWriter.write_file(patched_path, fw_file)
+
+    assert list(FileDiffer.iter_differences(patched_path, old_path)) == []
@@ -0,0 +1,106 @@
+import random
+from pathlib import Path
+
+import pytest
+
+from services.file_reader import FileReader
+from services.file_sorter import FileSorter
+from services.file_writer import FileWriter
+from utils.exceptions import FieldNotFoundException, FieldValueValidationException
+
+
+def _random_transactions(count: int) -> list[tuple[int, str]]:
+    rng = random.Random(42)
+    return [(rng.randint(0, 500), rng.choice(["USD", "EUR", "GBP"])) for _ in range(count)]
+
+
+def test_sort_by_amount_renumbers_counters(tmp_path, write_sample_file):
+    input_path = write_sample_file([(300, "USD"), (100, "EUR"), (200, "GBP")], "input.txt")
+    output_path = str(tmp_path / "sorted.txt")
+
+    assert FileSorter.sort_file(input_path, output_path, keys=("amount",)) == 3
+
+    fw_file = FileReader.read_file(output_path)
+    assert [(t.counter, int(t.amount * 100), t.currency) for t in fw_file.transactions] == [
+        (1, 100, "EUR"),
+        (2, 200, "GBP"),
+        (3, 300, "USD"),
+    ]
+    assert fw_file.footer.total_counter == 3
+    assert Path(output_path).read_text().splitlines()[0] == Path(input_path).read_text().splitlines()[0]
+
+
+def test_sort_by_currency_then_amount_descending(tmp_path, write_sample_file):
+    input_path = write_sample_file([(300, "USD"), (100, "EUR"), (200, "EUR"), (50, "USD")], "input.txt")
+    output_path = str(tmp_path / "sorted.txt")
+
+    FileSorter.sort_file(input_path, output_path, keys=("currency", "amount"), reverse=True)
+
+    fw_file = FileReader.read_file(output_path)
+    assert [(t.currency, int(t.amount * 100)) for t in fw_file.transactions] == [
+        ("USD", 300),
+        ("USD", 50),
+        ("EUR", 200),
+        ("EUR", 100),
+    ]
+
+
+def test_sort_is_stable(tmp_path, write_sample_file):
+    input_path = write_sample_file([(100, "USD"), (100, "EUR"), (100, "GBP")], "input.txt")
+    output_path = str(tmp_path / "sorted.txt")
+
+    FileSorter.sort_file(input_path, output_path, keys=("amount",))
+
+    assert [t.currency for t in FileReader.read_file(output_path).transactions] == ["USD", "EUR", "GBP"]
+
+
+def test_external_sort_matches_in_memory_sort(tmp_path, write_sample_file):
+    input_path = write_sample_file(_random_transactions(5000), "input.txt")
+    in_memory_path = str(tmp_path / "in_memory.txt")
+    external_path = str(tmp_path / "external.txt")
+
+    FileSorter.sort_file(input_path, in_memory_path, keys=("currency", "amount"))
+    FileSorter.sort_file(input_path, external_path, keys=("currency", "amount"), memory_budget=1)
+
+    assert Path(external_path).read_bytes() == Path(in_memory_path).read_bytes()
+    FileReader.read_file(external_path).validate()
+
+
+def test_unknown_sort_key(tmp_path, write_sample_file):
+    input_path = write_sample_file([(100, "USD")], "input.txt")
+
+    with pytest.raises(FieldNotFoundException):
+        FileSorter.sort_file(input_path, str(tmp_path / "sorted.txt"), keys=("name",))
+
+
+def test_footer_mismatch_is_rejected(write_sample_file):
+    input_path = write_sample_file([(300, "USD"), (100, "EUR")], "input.txt", control_sum=999)
+    original = Path(input_path).read_bytes()
+
+    with pytest.raises(FieldValueValidationException):
+        FileSorter.sort_file(input_path, input_path, keys=("amount",))
+    assert Path(input_path).read_bytes() == original
+
+
+def test_unexpected_field_id_is_rejected(tmp_path, write_sample_file):
+    input_path = write_sample_file(
+        [(300, "USD"), (100, "EUR")], "input.txt", replace_lines={3: f"{'07000002000000000100EUR':<119}\n"}
+    )
+
+    with pytest.raises(FieldValueValidationException):
+        FileSorter.sort_file(input_path, str(tmp_path / "sorted.txt"), keys=("amount",))
+
+
+def test_failed_in_place_sort_keeps_original(tmp_path, write_sample_file, monkeypatch):
+    input_path = write_sample_file([(300, "USD"), (100, "EUR")], "input.txt")
+    original = Path(input_path).read_bytes()
+
+    def failing_footer(*args, **kwargs) -> str:
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(FileWriter, "format_footer_record", failing_footer)
+    with pytest.raises(OSError):
+        FileSorter.sort_file(input_path, input_path, keys=("amount",))
+
+    assert Path(input_path).read_bytes() == original
+    assert [path.name for path in tmp_path.iterdir()] == ["input.txt"]
@@ -0,0 +1,71 @@
+import pytest
+
+from services.file_reader import FileReader
+from services.file_validator import FileValidator
+from utils.exceptions import FieldValueValidationException, LineLengthException
+
+
+def test_valid_file_has_no_issues(sample_file_path: str):
+    report = FileValidator.validate_file(sample_file_path)
+
+    assert report.is_valid
+    assert report.lines_checked == 4
+
+
+def test_collects_all_errors_with_line_numbers(write_sample_file):
+    file_path = write_sample_file(
+        [(1500, "XXX"), (2750, "EUR"), (0, "USD")],
+        patronymic="",
+        total_counter=2,
+        replace_lines={
+            3: f"{'02000002000000002750EUR':<80}\n",
+            4: f"{'0200000300000000A000USD':<119}\n",
+        },
+    )
+
+    report = FileValidator.validate_file(file_path)
+
+    assert [(i.line_number, i.record_type, i.field) for i in report.issues] == [
+        (1, "header", "patronymic"),
+        (2, "transaction", "currency"),
+        (3, "transaction", "record"),
+        (4, "transaction", "amount"),
+        (5, "footer", "total_counter"),
+    ]
+    assert report.issues[1].value == "XXX"
+    assert not report.truncated
+
+
+def test_reports_control_sum_mismatch(write_sample_file):
+    file_path = write_sample_file([(1500, "USD")], control_sum=9999)
+
+    report = FileValidator.validate_file(file_path)
+
+    assert [(i.record_type, i.field) for i in report.issues] == [("footer", "control_sum")]
+
+
+def test_error_cap_stops_validation(write_sample_file):
+    file_path = write_sample_file([(1500, "XXX")] * 100)
+
+    report = FileValidator.validate_file(file_path, max_errors=10)
+
+    assert len(report.issues) == 10
+    assert report.truncated
+
+
+def test_reader_reports_line_number(write_sample_file):
+    file_path = write_sample_file(
+        [(1500, "USD"), (2750, "EUR")], replace_lines={3: f"{'02000002000000002750EUR':<80}\n"}
+    )
+
+    with pytest.raises(LineLengthException) as exc_info:
+        FileReader.read_file(file_path)
+    assert exc_info.value.line_number == 3
+
+    file_path = write_sample_file([(1500, "USD"), (2750, "XYZ")])
+
+    with pytest.raises(FieldValueValidationException) as field_exc_info:
+        FileReader.read_file(file_path)
+    assert field_exc_info.value.field_name == "Currency"
+    assert field_exc_info.value.line_number == 3
+    assert "(line 3)" in str(field_exc_info.value)
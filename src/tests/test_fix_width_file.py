@@ -95,3 +95,34 @@ def test_invalid_transaction_index(fixed_width_file: FixedWidthFile):
 def test_invalid_currency(fixed_width_file: FixedWidthFile):
     with pytest.raises(FieldValueValidationException):
         fixed_width_file.set_field_value("transaction", "currency", "INVALID", 0)
+
+
+def test_add_transactions(fixed_width_file: FixedWidthFile):
+    new_transactions = [
+        Transaction("02", "000003", "000000003000", "GBP"),
+        Transaction("02", "000004", "000000000550", "USD"),
+    ]
+    fixed_width_file.add_transactions(new_transactions)
+    assert fixed_width_file.transactions[-2:] == new_transactions
+    assert fixed_width_file.footer.total_counter == 4
+    assert fixed_width_file.footer.control_sum == Decimal("65.50")
+    fixed_width_file.validate()
+
+
+def test_add_transactions_limit_exceeded(fixed_width_file: FixedWidthFile):
+    new_transactions = [
+        Transaction.from_values("02", i + 3, Decimal("1.00"), "USD") for i in range(FieldLimits.MAX_TRANSACTIONS - 1)
+    ]
+    with pytest.raises(RecordLimitException):
+        fixed_width_file.add_transactions(new_transactions)
+    assert len(fixed_width_file.transactions) == 2
+
+
+def test_remove_transaction(fixed_width_file: FixedWidthFile):
+    fixed_width_file.remove_transaction(0)
+    assert len(fixed_width_file.transactions) == 1
+    assert fixed_width_file.footer.total_counter == 1
+    assert fixed_width_file.footer.control_sum == Decimal("20.00")
+
+    with pytest.raises(ValueError):
+        fixed_width_file.remove_transaction(5)
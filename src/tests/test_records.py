@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+import pytest
+
+from models.base import BaseField
+from models.footer import Footer
+from models.header import Header
+from models.transaction import Transaction
+from services.file_reader import FileReader
+from utils.exceptions import FieldValueValidationException, LineLengthException
+
+
+def test_records_have_no_instance_dict(sample_header: Header, sample_transactions: list[Transaction]):
+    records: tuple[BaseField, ...] = (sample_header, sample_transactions[0])
+    for record in records:
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            setattr(record, "unknown_field", "value")
+
+
+def test_from_values_builds_typed_records():
+    transaction = Transaction.from_values("02", 7, Decimal("12.34"), "EUR")
+    footer = Footer.from_values("03", 1, Decimal("12.34"))
+
+    assert (transaction.field_id, transaction.counter, transaction.amount, transaction.currency) == (
+        "02",
+        7,
+        Decimal("12.34"),
+        "EUR",
+    )
+    assert (footer.total_counter, footer.control_sum) == (1, Decimal("12.34"))
+
+
+def test_trusted_read_matches_validated_read(sample_file_path: str):
+    validated = FileReader.read_file(sample_file_path)
+    trusted = FileReader.read_file(sample_file_path, trusted=True)
+
+    assert trusted.header.address == validated.header.address
+    assert [(t.counter, t.amount, t.currency) for t in trusted.transactions] == [
+        (t.counter, t.amount, t.currency) for t in validated.transactions
+    ]
+    assert trusted.footer.control_sum == validated.footer.control_sum
+
+
+@pytest.mark.parametrize(
+    "transaction_line, exception",
+    [
+        (f"{'02000002000000002750EU':<118}\n", LineLengthException),
+        (f"{'09000002000000002750EUR':<119}\n", FieldValueValidationException),
+    ],
+)
+def test_trusted_read_checks_record_structure(write_sample_file, transaction_line: str, exception: type[Exception]):
+    file_path = write_sample_file([(1500, "USD"), (2750, "EUR")], replace_lines={3: transaction_line})
+
+    with pytest.raises(exception):
+        FileReader.read_file(file_path, trusted=True)
@@ -0,0 +1,65 @@
+import bz2
+import gzip
+import lzma
+import os
+from typing import IO, Any, cast
+
+from utils.exceptions import UnsupportedCompressionException
+
+MAGIC_BYTES: dict[str, bytes] = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+EXTENSIONS: dict[str, str] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+}
+DEFAULT_COMPRESSION_LEVELS: dict[str, int] = {
+    "gzip": 6,
+    "bz2": 9,
+    "xz": 6,
+}
+
+
+def detect_compression(file_path: str) -> str | None:
+    with open(file_path, "rb") as f:
+        head = f.read(max(len(magic) for magic in MAGIC_BYTES.values()))
+    for compression, magic in MAGIC_BYTES.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def compression_from_extension(file_path: str) -> str | None:
+    return EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def open_file(
+    file_path: str, mode: str = "r", compression: str | None = None, compression_level: int | None = None
+) -> IO[Any]:
+    if compression is None:
+        compression = detect_compression(file_path) if "r" in mode else compression_from_extension(file_path)
+    if compression is None:
+        return open(file_path, mode)
+    if compression not in MAGIC_BYTES:
+        raise UnsupportedCompressionException(compression)
+
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+    if "r" in mode:
+        level = None
+    else:
+        level = DEFAULT_COMPRESSION_LEVELS[compression] if compression_level is None else compression_level
+
+    # The codecs return GzipFile/BZ2File/LZMAFile in binary mode and TextIOWrapper in text mode,
+    # all of which behave as IO objects but are not typed as such.
+    stream: object
+    if compression == "gzip":
+        stream = gzip.open(file_path, mode) if level is None else gzip.open(file_path, mode, compresslevel=level)
+    elif compression == "bz2":
+        stream = bz2.open(file_path, mode) if level is None else bz2.open(file_path, mode, compresslevel=level)
+    else:
+        stream = lzma.open(file_path, mode) if level is None else lzma.open(file_path, mode, preset=level)
+    return cast(IO[Any], stream)
@@ -12,8 +12,12 @@ class ValidationException(BaseServiceException):
 
 
 class FieldValueValidationException(ValidationException):
-    def __init__(self, field_name: str, value: str | int | Decimal):
-        super().__init__(f"Invalid value for field {field_name}: {value}")
+    def __init__(self, field_name: str, value: str | int | Decimal, line_number: int | None = None):
+        location = f" (line {line_number})" if line_number is not None else ""
+        super().__init__(f"Invalid value for field {field_name}: {value}{location}")
+        self.field_name = field_name
+        self.value = value
+        self.line_number = line_number
 
 
 class RecordLimitException(ValidationException):
@@ -27,8 +31,10 @@ class FileStructureException(ValidationException):
 
 
 class LineLengthException(ValidationException):
-    def __init__(self, limit: int, length: int):
-        super().__init__(f"Length of the line must be {limit}, {length}")
+    def __init__(self, limit: int, length: int, line_number: int | None = None):
+        location = f" (line {line_number})" if line_number is not None else ""
+        super().__init__(f"Length of the line must be {limit}, {length}{location}")
+        self.line_number = line_number
 
 
 class FieldLockedException(BaseServiceException):
@@ -44,3 +50,8 @@ class FieldNotFoundException(BaseServiceException):
 class FooterManualChangeException(BaseServiceException):
     def __init__(self, message: str | None = None):
         super().__init__(message or "Footer manual change is not allowed")
+
+
+class UnsupportedCompressionException(BaseServiceException):
+    def __init__(self, compression: str):
+        super().__init__(f"Unsupported compression: {compression}")
@@ -0,0 +1,39 @@
+from utils.constraints import FieldLengths
+
+HEADER_FIELDS: tuple[tuple[str, int], ...] = (
+    ("field_id", FieldLengths.FIELD_ID),
+    ("name", FieldLengths.NAME),
+    ("surname", FieldLengths.SURNAME),
+    ("patronymic", FieldLengths.PATRONYMIC),
+    ("address", FieldLengths.ADDRESS),
+)
+TRANSACTION_FIELDS: tuple[tuple[str, int], ...] = (
+    ("field_id", FieldLengths.FIELD_ID),
+    ("counter", FieldLengths.COUNTER),
+    ("amount", FieldLengths.AMOUNT),
+    ("currency", FieldLengths.CURRENCY),
+)
+FOOTER_FIELDS: tuple[tuple[str, int], ...] = (
+    ("field_id", FieldLengths.FIELD_ID),
+    ("total_counter", FieldLengths.TOTAL_COUNTER),
+    ("control_sum", FieldLengths.CONTROL_SUM),
+)
+
+
+def field_slices(fields: tuple[tuple[str, int], ...]) -> tuple[tuple[str, slice], ...]:
+    slices = []
+    start = 0
+    for name, length in fields:
+        slices.append((name, slice(start, start + length)))
+        start += length
+    return tuple(slices)
+
+
+HEADER_SLICES = field_slices(HEADER_FIELDS)
+TRANSACTION_SLICES = field_slices(TRANSACTION_FIELDS)
+FOOTER_SLICES = field_slices(FOOTER_FIELDS)
+RECORD_SLICES: dict[str, tuple[tuple[str, slice], ...]] = {
+    "header": HEADER_SLICES,
+    "transaction": TRANSACTION_SLICES,
+    "footer": FOOTER_SLICES,
+}